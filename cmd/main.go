@@ -26,6 +26,9 @@ type Config struct {
 		UpdateInterval time.Duration `yaml:"update_interval"`
 		EnableMetrics  bool          `yaml:"enable_metrics"`
 		LogLevel       string        `yaml:"log_level"`
+
+		DiscoveryTimeout  time.Duration `yaml:"discovery_timeout"`
+		DiscoveryCacheTTL time.Duration `yaml:"discovery_cache_ttl"`
 	} `yaml:"gateway"`
 
 	Protocols struct {
@@ -94,6 +97,9 @@ func main() {
 		UpdateInterval: config.Gateway.UpdateInterval,
 		EnableMetrics:  config.Gateway.EnableMetrics,
 		LogLevel:       config.Gateway.LogLevel,
+
+		DiscoveryTimeout:  config.Gateway.DiscoveryTimeout,
+		DiscoveryCacheTTL: config.Gateway.DiscoveryCacheTTL,
 	}
 
 	// Create and start the gateway
@@ -134,6 +140,8 @@ func loadConfig(filename string) (*Config, error) {
 	config.Gateway.UpdateInterval = 1 * time.Second
 	config.Gateway.EnableMetrics = true
 	config.Gateway.LogLevel = "info"
+	config.Gateway.DiscoveryTimeout = 30 * time.Second
+	config.Gateway.DiscoveryCacheTTL = 60 * time.Second
 
 	config.Protocols.Modbus.DefaultTimeout = 5 * time.Second
 	config.Protocols.Modbus.DefaultUnitID = 1
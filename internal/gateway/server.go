@@ -2,7 +2,10 @@ package gateway
 
 import (
 	"context"
+	"encoding/json"
+	"errors"
 	"fmt"
+	"net"
 	"net/http"
 	"sync"
 	"time"
@@ -21,6 +24,12 @@ type IndustrialGateway struct {
 	devices   sync.Map // map[string]*Device
 	protocols map[string]protocols.ProtocolHandler
 
+	// One protocol name per distinct handler, used to fan out discovery
+	discoveryProtocols []string
+
+	// Recent discovery results keyed by normalized network range
+	discoveryCache sync.Map // map[string]*discoveryResult
+
 	// Performance metrics
 	metrics struct {
 		connectionsTotal    prometheus.Counter
@@ -45,6 +54,11 @@ type Config struct {
 	UpdateInterval time.Duration `yaml:"update_interval"`
 	EnableMetrics  bool          `yaml:"enable_metrics"`
 	LogLevel       string        `yaml:"log_level"`
+
+	// DiscoveryTimeout bounds each protocol's scan; zero leaves it to the caller's context
+	DiscoveryTimeout time.Duration `yaml:"discovery_timeout"`
+	// DiscoveryCacheTTL is how long discovery results are reused; zero disables caching
+	DiscoveryCacheTTL time.Duration `yaml:"discovery_cache_ttl"`
 }
 
 type Device struct {
@@ -84,6 +98,16 @@ type Tag struct {
 	Description string      `json:"description"`
 }
 
+// maxDiscoveryHostBits caps discovery at a /16 so a single request cannot
+// sweep millions of addresses
+const maxDiscoveryHostBits = 16
+
+// discoveryResult holds devices found by a completed network scan
+type discoveryResult struct {
+	devices   []*protocols.Device
+	expiresAt time.Time
+}
+
 // NewIndustrialGateway creates a new gateway instance
 func NewIndustrialGateway(config *Config, logger *zap.Logger) *IndustrialGateway {
 	gateway := &IndustrialGateway{
@@ -140,16 +164,30 @@ func (g *IndustrialGateway) initMetrics() {
 func (g *IndustrialGateway) registerProtocols() {
 	// Register Modbus TCP/RTU handler
 	modbusHandler := protocols.NewModbusHandler(g.logger)
-	g.protocols["modbus-tcp"] = modbusHandler
-	g.protocols["modbus-rtu"] = modbusHandler
+	g.registerProtocol("modbus-tcp", modbusHandler)
+	g.registerProtocol("modbus-rtu", modbusHandler)
 
 	// Register OPC UA handler
 	opcuaHandler := protocols.NewOPCUAHandler(g.logger)
-	g.protocols["opcua"] = opcuaHandler
+	g.registerProtocol("opcua", opcuaHandler)
 
 	// TODO: Add Ethernet/IP, S7, etc.
 }
 
+// registerProtocol maps a protocol name to its handler. A handler shared by
+// several names is recorded for discovery only under the first one.
+func (g *IndustrialGateway) registerProtocol(name string, handler protocols.ProtocolHandler) {
+	for _, registered := range g.discoveryProtocols {
+		if g.protocols[registered] == handler {
+			g.protocols[name] = handler
+			return
+		}
+	}
+
+	g.protocols[name] = handler
+	g.discoveryProtocols = append(g.discoveryProtocols, name)
+}
+
 // Start begins the gateway services
 func (g *IndustrialGateway) Start(ctx context.Context) error {
 	g.logger.Info("Starting Bifrost Industrial Gateway",
@@ -283,6 +321,21 @@ func (g *IndustrialGateway) collectDeviceData(ctx context.Context, device *Devic
 		Config:   device.Config,
 	}
 
+	// Failed reads are reported once per collection cycle rather than per tag,
+	// including cycles cut short by cancellation
+	var failedTags []string
+	var lastErr error
+	defer func() {
+		if len(failedTags) > 0 {
+			g.logger.Error("Failed to read tags",
+				zap.String("device", device.ID),
+				zap.Strings("tags", failedTags),
+				zap.Int("failed", len(failedTags)),
+				zap.Error(lastErr),
+			)
+		}
+	}()
+
 	// Read all tags for this device
 	for _, tag := range device.Tags {
 		select {
@@ -304,11 +357,8 @@ func (g *IndustrialGateway) collectDeviceData(ctx context.Context, device *Devic
 			if err != nil {
 				g.metrics.errorRate.Inc()
 				device.Stats.RequestsFailed++
-				g.logger.Error("Failed to read tag",
-					zap.String("device", device.ID),
-					zap.String("tag", tag.ID),
-					zap.Error(err),
-				)
+				failedTags = append(failedTags, tag.ID)
+				lastErr = err
 				continue
 			}
 
@@ -325,8 +375,9 @@ func (g *IndustrialGateway) collectDeviceData(ctx context.Context, device *Devic
 		}
 	}
 
-	device.LastSeen = time.Now()
-	device.Stats.LastUpdate = time.Now()
+	now := time.Now()
+	device.LastSeen = now
+	device.Stats.LastUpdate = now
 }
 
 // ConnectDevice establishes connection to an industrial device
@@ -400,6 +451,134 @@ func (g *IndustrialGateway) DisconnectDevice(deviceID string) error {
 	return nil
 }
 
+// DiscoverDevices scans a network range with every registered protocol handler.
+// Results of complete scans are cached for DiscoveryCacheTTL, so repeated
+// requests for the same range are answered without touching the network.
+func (g *IndustrialGateway) DiscoverDevices(ctx context.Context, networkRange string) ([]*protocols.Device, error) {
+	_, network, err := net.ParseCIDR(networkRange)
+	if err != nil {
+		return nil, fmt.Errorf("invalid network range: %w", err)
+	}
+	// Every protocol scans through the IPv4-only network scanner
+	if network.IP.To4() == nil {
+		return nil, fmt.Errorf("network range %s is not IPv4", networkRange)
+	}
+	if ones, bits := network.Mask.Size(); bits-ones > maxDiscoveryHostBits {
+		return nil, fmt.Errorf("network range %s is too broad: at most %d host bits allowed", networkRange, maxDiscoveryHostBits)
+	}
+
+	// Normalize so equivalent ranges such as 10.0.0.7/24 and 10.0.0.0/24 share an entry
+	cacheKey := network.String()
+	ttl := g.config.DiscoveryCacheTTL
+
+	if ttl > 0 {
+		if cached, ok := g.discoveryCache.Load(cacheKey); ok {
+			result := cached.(*discoveryResult)
+			if time.Now().Before(result.expiresAt) {
+				return append(make([]*protocols.Device, 0, len(result.devices)), result.devices...), nil
+			}
+			g.discoveryCache.Delete(cacheKey)
+		}
+	}
+
+	devices, complete := g.discoverAllProtocols(ctx, cacheKey)
+
+	// Only cache scans in which every protocol ran to completion
+	if ttl > 0 && complete {
+		now := time.Now()
+		g.sweepDiscoveryCache(now)
+		g.discoveryCache.Store(cacheKey, &discoveryResult{
+			devices:   append(make([]*protocols.Device, 0, len(devices)), devices...),
+			expiresAt: now.Add(ttl),
+		})
+	}
+
+	return devices, nil
+}
+
+// sweepDiscoveryCache drops expired results so ranges that are never
+// requested again do not stay in memory
+func (g *IndustrialGateway) sweepDiscoveryCache(now time.Time) {
+	g.discoveryCache.Range(func(key, value interface{}) bool {
+		if !now.Before(value.(*discoveryResult).expiresAt) {
+			g.discoveryCache.Delete(key)
+		}
+		return true
+	})
+}
+
+// discoverAllProtocols runs every handler's discovery concurrently, so a scan
+// takes as long as the slowest protocol rather than the sum of all of them.
+// Each protocol gets its own DiscoveryTimeout budget; a protocol that fails or
+// runs out of time is logged and does not discard devices found by the others,
+// but marks the result as incomplete.
+func (g *IndustrialGateway) discoverAllProtocols(ctx context.Context, networkRange string) ([]*protocols.Device, bool) {
+	var (
+		wg    sync.WaitGroup
+		mutex sync.Mutex
+	)
+	devices := make([]*protocols.Device, 0)
+	complete := true
+
+	// Collapse duplicate hits on the same endpoint while keeping the same
+	// address found by different protocols
+	type endpoint struct {
+		protocol, address string
+		port              int
+	}
+	seen := make(map[endpoint]bool)
+
+	for _, name := range g.discoveryProtocols {
+		handler := g.protocols[name]
+
+		wg.Add(1)
+		go func(name string, handler protocols.ProtocolHandler) {
+			defer wg.Done()
+
+			scanCtx := ctx
+			if g.config.DiscoveryTimeout > 0 {
+				var cancel context.CancelFunc
+				scanCtx, cancel = context.WithTimeout(ctx, g.config.DiscoveryTimeout)
+				defer cancel()
+			}
+
+			found, err := handler.DiscoverDevices(scanCtx, networkRange)
+			switch {
+			case errors.Is(err, context.DeadlineExceeded):
+				g.logger.Info("Device discovery timed out",
+					zap.String("protocol", name),
+					zap.String("network", networkRange),
+					zap.Int("devices_found", len(found)),
+				)
+			case err != nil:
+				g.logger.Warn("Device discovery failed",
+					zap.String("protocol", name),
+					zap.String("network", networkRange),
+					zap.Error(err),
+				)
+			}
+
+			// Keep partial results from scans that were cut short
+			mutex.Lock()
+			if err != nil {
+				complete = false
+			}
+			for _, device := range found {
+				key := endpoint{device.Protocol, device.Address, device.Port}
+				if seen[key] {
+					continue
+				}
+				seen[key] = true
+				devices = append(devices, device)
+			}
+			mutex.Unlock()
+		}(name, handler)
+	}
+
+	wg.Wait()
+	return devices, complete
+}
+
 func (g *IndustrialGateway) broadcastTagUpdate(device *Device, tag *Tag) {
 	message := map[string]interface{}{
 		"type":      "tag_update",
@@ -485,8 +664,28 @@ func (g *IndustrialGateway) handleDevices(w http.ResponseWriter, r *http.Request
 func (g *IndustrialGateway) handleDiscovery(w http.ResponseWriter, r *http.Request) {
 	w.Header().Set("Content-Type", "application/json")
 
-	// TODO: Implement device discovery
-	w.Write([]byte(`{"message": "Device discovery not implemented yet"}`))
+	if r.Method != http.MethodGet {
+		w.Header().Set("Allow", http.MethodGet)
+		w.WriteHeader(http.StatusMethodNotAllowed)
+		w.Write([]byte(`{"error": "method not allowed"}`))
+		return
+	}
+
+	networkRange := r.URL.Query().Get("network")
+	if networkRange == "" {
+		w.WriteHeader(http.StatusBadRequest)
+		w.Write([]byte(`{"error": "network query parameter is required"}`))
+		return
+	}
+
+	devices, err := g.DiscoverDevices(r.Context(), networkRange)
+	if err != nil {
+		w.WriteHeader(http.StatusBadRequest)
+		json.NewEncoder(w).Encode(map[string]string{"error": err.Error()})
+		return
+	}
+
+	json.NewEncoder(w).Encode(map[string]interface{}{"devices": devices})
 }
 
 func (g *IndustrialGateway) handleTagRead(w http.ResponseWriter, r *http.Request) {
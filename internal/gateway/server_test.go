@@ -0,0 +1,319 @@
+package gateway
+
+import (
+	"context"
+	"errors"
+	"net/http"
+	"net/http/httptest"
+	"sync/atomic"
+	"testing"
+	"time"
+
+	"github.com/prometheus/client_golang/prometheus"
+	"go.uber.org/zap"
+
+	"github.com/bifrost/go-gateway/internal/protocols"
+)
+
+// fakeHandler is a ProtocolHandler whose read and discovery behaviour is supplied by the test
+type fakeHandler struct {
+	read     func(tag *protocols.Tag) (interface{}, error)
+	discover func(ctx context.Context, networkRange string) ([]*protocols.Device, error)
+	scans    int32
+}
+
+func (f *fakeHandler) Connect(device *protocols.Device) error    { return nil }
+func (f *fakeHandler) Disconnect(device *protocols.Device) error { return nil }
+func (f *fakeHandler) IsConnected(device *protocols.Device) bool { return true }
+
+func (f *fakeHandler) ReadTag(device *protocols.Device, tag *protocols.Tag) (interface{}, error) {
+	if f.read == nil {
+		return nil, errors.New("not implemented")
+	}
+	return f.read(tag)
+}
+
+func (f *fakeHandler) WriteTag(device *protocols.Device, tag *protocols.Tag, value interface{}) error {
+	return errors.New("not implemented")
+}
+
+func (f *fakeHandler) ReadMultipleTags(device *protocols.Device, tags []*protocols.Tag) (map[string]interface{}, error) {
+	return nil, errors.New("not implemented")
+}
+
+func (f *fakeHandler) DiscoverDevices(ctx context.Context, networkRange string) ([]*protocols.Device, error) {
+	atomic.AddInt32(&f.scans, 1)
+	if f.discover == nil {
+		return nil, nil
+	}
+	return f.discover(ctx, networkRange)
+}
+
+func (f *fakeHandler) GetDeviceInfo(device *protocols.Device) (*protocols.DeviceInfo, error) {
+	return nil, errors.New("not implemented")
+}
+
+func (f *fakeHandler) GetSupportedDataTypes() []string         { return nil }
+func (f *fakeHandler) ValidateTagAddress(address string) error { return nil }
+func (f *fakeHandler) Ping(device *protocols.Device) error     { return nil }
+
+func (f *fakeHandler) GetDiagnostics(device *protocols.Device) (*protocols.Diagnostics, error) {
+	return nil, errors.New("not implemented")
+}
+
+// newTestGateway builds a gateway without the default protocol handlers or
+// global metric registration, so tests can register fakes and run in any order
+func newTestGateway(config *Config) *IndustrialGateway {
+	g := &IndustrialGateway{
+		logger:    zap.NewNop(),
+		protocols: make(map[string]protocols.ProtocolHandler),
+		config:    config,
+	}
+	g.metrics.connectionsTotal = prometheus.NewCounter(prometheus.CounterOpts{Name: "test_connections_total"})
+	g.metrics.dataPointsProcessed = prometheus.NewCounter(prometheus.CounterOpts{Name: "test_data_points_processed_total"})
+	g.metrics.errorRate = prometheus.NewCounter(prometheus.CounterOpts{Name: "test_errors_total"})
+	g.metrics.responseTime = prometheus.NewHistogram(prometheus.HistogramOpts{Name: "test_response_time_seconds"})
+	return g
+}
+
+func TestCollectDeviceDataReadsEachTag(t *testing.T) {
+	g := newTestGateway(&Config{})
+
+	// Values a Modbus device would return for a coil and a 32-bit float register pair
+	values := map[string]interface{}{
+		"00003": true,
+		"40010": float32(12.5),
+	}
+	handler := &fakeHandler{read: func(tag *protocols.Tag) (interface{}, error) {
+		value, ok := values[tag.Address]
+		if !ok {
+			return nil, errors.New("illegal data address")
+		}
+		return value, nil
+	}}
+	g.registerProtocol("modbus-tcp", handler)
+
+	device := &Device{
+		ID:       "plc-1",
+		Protocol: "modbus-tcp",
+		Tags: map[string]*Tag{
+			"coil":    {ID: "coil", Address: "00003", DataType: "bool"},
+			"float":   {ID: "float", Address: "40010", DataType: "float32"},
+			"missing": {ID: "missing", Address: "40100", DataType: "uint16"},
+		},
+	}
+
+	g.collectDeviceData(context.Background(), device)
+
+	if tag := device.Tags["coil"]; tag.Value != true || tag.Quality != "GOOD" {
+		t.Errorf("Expected coil = true with GOOD quality, got %v (%s)", tag.Value, tag.Quality)
+	}
+	if tag := device.Tags["float"]; tag.Value != float32(12.5) || tag.Quality != "GOOD" {
+		t.Errorf("Expected float = 12.5 with GOOD quality, got %v (%s)", tag.Value, tag.Quality)
+	}
+	if tag := device.Tags["missing"]; tag.Value != nil || tag.Quality != "" {
+		t.Errorf("Expected unreadable tag to be left unset, got %v (%s)", tag.Value, tag.Quality)
+	}
+	if device.Stats.RequestsSuccessful != 2 || device.Stats.RequestsFailed != 1 {
+		t.Errorf("Expected 2 successful and 1 failed read, got %d and %d",
+			device.Stats.RequestsSuccessful, device.Stats.RequestsFailed)
+	}
+}
+
+func TestDiscoverDevicesKeepsResultsFromHealthyProtocols(t *testing.T) {
+	g := newTestGateway(&Config{})
+
+	healthy := &fakeHandler{discover: func(ctx context.Context, networkRange string) ([]*protocols.Device, error) {
+		return []*protocols.Device{{Protocol: "modbus-tcp", Address: "10.0.0.5", Port: 502}}, nil
+	}}
+	failing := &fakeHandler{discover: func(ctx context.Context, networkRange string) ([]*protocols.Device, error) {
+		return nil, errors.New("scan failed")
+	}}
+	g.registerProtocol("modbus-tcp", healthy)
+	g.registerProtocol("ethernet-ip", failing)
+
+	devices, err := g.DiscoverDevices(context.Background(), "10.0.0.0/24")
+	if err != nil {
+		t.Fatalf("Unexpected error: %v", err)
+	}
+	if len(devices) != 1 || devices[0].Address != "10.0.0.5" {
+		t.Errorf("Expected device at 10.0.0.5 from healthy protocol, got %v", devices)
+	}
+}
+
+func TestDiscoverDevicesTimesOutSlowProtocol(t *testing.T) {
+	g := newTestGateway(&Config{DiscoveryTimeout: 20 * time.Millisecond, DiscoveryCacheTTL: time.Minute})
+
+	slow := &fakeHandler{discover: func(ctx context.Context, networkRange string) ([]*protocols.Device, error) {
+		<-ctx.Done()
+		return []*protocols.Device{{Protocol: "ethernet-ip", Address: "10.0.0.9", Port: 44818}}, ctx.Err()
+	}}
+	fast := &fakeHandler{discover: func(ctx context.Context, networkRange string) ([]*protocols.Device, error) {
+		return []*protocols.Device{{Protocol: "modbus-tcp", Address: "10.0.0.5", Port: 502}}, nil
+	}}
+	g.registerProtocol("ethernet-ip", slow)
+	g.registerProtocol("modbus-tcp", fast)
+
+	devices, err := g.DiscoverDevices(context.Background(), "10.0.0.0/24")
+	if err != nil {
+		t.Fatalf("Unexpected error: %v", err)
+	}
+
+	// Partial results from the timed-out protocol are kept alongside the others
+	if len(devices) != 2 {
+		t.Errorf("Expected devices from both protocols, got %v", devices)
+	}
+	if _, found := g.discoveryCache.Load("10.0.0.0/24"); found {
+		t.Error("Expected incomplete scan not to be cached")
+	}
+}
+
+func TestDiscoverDevicesDoesNotCacheFailedScan(t *testing.T) {
+	g := newTestGateway(&Config{DiscoveryCacheTTL: time.Minute})
+	g.registerProtocol("modbus-tcp", &fakeHandler{})
+	g.registerProtocol("ethernet-ip", &fakeHandler{discover: func(ctx context.Context, networkRange string) ([]*protocols.Device, error) {
+		return nil, errors.New("scan failed")
+	}})
+
+	if _, err := g.DiscoverDevices(context.Background(), "10.0.0.0/24"); err != nil {
+		t.Fatalf("Unexpected error: %v", err)
+	}
+	if _, found := g.discoveryCache.Load("10.0.0.0/24"); found {
+		t.Error("Expected failed scan not to be cached")
+	}
+}
+
+func TestDiscoverDevicesScansSharedHandlerOnce(t *testing.T) {
+	g := newTestGateway(&Config{})
+
+	var received string
+	shared := &fakeHandler{discover: func(ctx context.Context, networkRange string) ([]*protocols.Device, error) {
+		received = networkRange
+		return nil, nil
+	}}
+	g.registerProtocol("modbus-tcp", shared)
+	g.registerProtocol("modbus-rtu", shared)
+
+	if _, err := g.DiscoverDevices(context.Background(), "10.0.0.7/24"); err != nil {
+		t.Fatalf("Unexpected error: %v", err)
+	}
+	if scans := atomic.LoadInt32(&shared.scans); scans != 1 {
+		t.Errorf("Expected shared handler to scan once, got %d", scans)
+	}
+	if received != "10.0.0.0/24" {
+		t.Errorf("Expected normalized network range, got %q", received)
+	}
+	if g.protocols["modbus-rtu"] != shared {
+		t.Error("Expected second protocol name to map to the shared handler")
+	}
+}
+
+func TestDiscoverDevicesRejectsInvalidRanges(t *testing.T) {
+	g := newTestGateway(&Config{})
+	handler := &fakeHandler{}
+	g.registerProtocol("modbus-tcp", handler)
+
+	for _, networkRange := range []string{"not-a-network", "10.0.0.0/8", "0.0.0.0/0", "2001:db8::/64", "2001:db8::/112"} {
+		if _, err := g.DiscoverDevices(context.Background(), networkRange); err == nil {
+			t.Errorf("Expected %q to be rejected", networkRange)
+		}
+	}
+	if scans := atomic.LoadInt32(&handler.scans); scans != 0 {
+		t.Errorf("Expected no scans for rejected ranges, got %d", scans)
+	}
+
+	if _, err := g.DiscoverDevices(context.Background(), "10.1.0.0/16"); err != nil {
+		t.Errorf("Expected /16 to be accepted, got: %v", err)
+	}
+}
+
+func TestDiscoverDevicesCache(t *testing.T) {
+	g := newTestGateway(&Config{DiscoveryCacheTTL: time.Minute})
+	handler := &fakeHandler{discover: func(ctx context.Context, networkRange string) ([]*protocols.Device, error) {
+		return []*protocols.Device{{Protocol: "modbus-tcp", Address: "10.0.0.5", Port: 502}}, nil
+	}}
+	g.registerProtocol("modbus-tcp", handler)
+
+	// Miss: the first request scans
+	if _, err := g.DiscoverDevices(context.Background(), "10.0.0.0/24"); err != nil {
+		t.Fatalf("Unexpected error: %v", err)
+	}
+	if scans := atomic.LoadInt32(&handler.scans); scans != 1 {
+		t.Fatalf("Expected one scan on cache miss, got %d", scans)
+	}
+
+	// Hit: an equivalent range is answered from the cache
+	devices, err := g.DiscoverDevices(context.Background(), "10.0.0.9/24")
+	if err != nil {
+		t.Fatalf("Unexpected error: %v", err)
+	}
+	if scans := atomic.LoadInt32(&handler.scans); scans != 1 {
+		t.Errorf("Expected cache hit without scanning, got %d scans", scans)
+	}
+	if len(devices) != 1 || devices[0].Address != "10.0.0.5" {
+		t.Errorf("Expected cached device at 10.0.0.5, got %v", devices)
+	}
+
+	// Expiry: a stale entry is rescanned
+	cached, _ := g.discoveryCache.Load("10.0.0.0/24")
+	cached.(*discoveryResult).expiresAt = time.Now().Add(-time.Second)
+
+	if _, err := g.DiscoverDevices(context.Background(), "10.0.0.0/24"); err != nil {
+		t.Fatalf("Unexpected error: %v", err)
+	}
+	if scans := atomic.LoadInt32(&handler.scans); scans != 2 {
+		t.Errorf("Expected expired entry to be rescanned, got %d scans", scans)
+	}
+}
+
+func TestDiscoverDevicesSweepsExpiredEntries(t *testing.T) {
+	g := newTestGateway(&Config{DiscoveryCacheTTL: time.Minute})
+	g.registerProtocol("modbus-tcp", &fakeHandler{})
+
+	g.discoveryCache.Store("192.168.1.0/24", &discoveryResult{expiresAt: time.Now().Add(-time.Second)})
+	g.discoveryCache.Store("192.168.2.0/24", &discoveryResult{expiresAt: time.Now().Add(time.Minute)})
+
+	if _, err := g.DiscoverDevices(context.Background(), "10.0.0.0/24"); err != nil {
+		t.Fatalf("Unexpected error: %v", err)
+	}
+
+	if _, found := g.discoveryCache.Load("192.168.1.0/24"); found {
+		t.Error("Expected expired entry to be swept")
+	}
+	if _, found := g.discoveryCache.Load("192.168.2.0/24"); !found {
+		t.Error("Expected live entry to be kept")
+	}
+	if _, found := g.discoveryCache.Load("10.0.0.0/24"); !found {
+		t.Error("Expected new result to be cached")
+	}
+}
+
+func TestHandleDiscoveryRequiresGet(t *testing.T) {
+	g := newTestGateway(&Config{})
+	handler := &fakeHandler{}
+	g.registerProtocol("modbus-tcp", handler)
+
+	recorder := httptest.NewRecorder()
+	g.handleDiscovery(recorder, httptest.NewRequest(http.MethodPost, "/api/devices/discover?network=10.0.0.0/24", nil))
+	if recorder.Code != http.StatusMethodNotAllowed {
+		t.Errorf("Expected status %d for POST, got %d", http.StatusMethodNotAllowed, recorder.Code)
+	}
+	if allow := recorder.Header().Get("Allow"); allow != http.MethodGet {
+		t.Errorf("Expected Allow header %q, got %q", http.MethodGet, allow)
+	}
+
+	recorder = httptest.NewRecorder()
+	g.handleDiscovery(recorder, httptest.NewRequest(http.MethodGet, "/api/devices/discover?network=2001:db8::/112", nil))
+	if recorder.Code != http.StatusBadRequest {
+		t.Errorf("Expected status %d for IPv6 range, got %d", http.StatusBadRequest, recorder.Code)
+	}
+
+	recorder = httptest.NewRecorder()
+	g.handleDiscovery(recorder, httptest.NewRequest(http.MethodGet, "/api/devices/discover?network=10.0.0.0/24", nil))
+	if recorder.Code != http.StatusOK {
+		t.Errorf("Expected status %d for GET, got %d", http.StatusOK, recorder.Code)
+	}
+	if scans := atomic.LoadInt32(&handler.scans); scans != 1 {
+		t.Errorf("Expected one scan, got %d", scans)
+	}
+}
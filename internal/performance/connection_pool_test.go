@@ -0,0 +1,75 @@
+package performance
+
+import (
+	"context"
+	"runtime"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+	"go.uber.org/zap"
+)
+
+// mockConnection is a Connection that never touches the network
+type mockConnection struct {
+	id int
+}
+
+func (c *mockConnection) Connect() error    { return nil }
+func (c *mockConnection) Disconnect() error { return nil }
+func (c *mockConnection) IsHealthy() bool   { return true }
+
+func (c *mockConnection) Execute(ctx context.Context, request interface{}) (interface{}, error) {
+	return request, nil
+}
+
+func (c *mockConnection) GetStats() ConnectionStats { return ConnectionStats{} }
+
+func TestConnectionPoolMemory(t *testing.T) {
+	// Test that connection pools don't leak memory
+	logger := zap.NewNop()
+	config := &PoolConfig{
+		MaxConnectionsPerDevice: 10,
+		ConnectionTimeout:       time.Second,
+		IdleTimeout:             time.Minute,
+		HealthCheckInterval:     time.Minute,
+	}
+
+	runtime.GC()
+	var m1 runtime.MemStats
+	runtime.ReadMemStats(&m1)
+
+	// Create and destroy many connections
+	for i := 0; i < 1000; i++ {
+		pool := NewConnectionPool(config, logger)
+		factory := func() (Connection, error) {
+			return &mockConnection{id: i}, nil
+		}
+
+		// Get and release connections
+		conns := make([]*PooledConnection, 5)
+		for j := 0; j < 5; j++ {
+			conn, err := pool.GetConnection("device-1", factory)
+			if !assert.NoError(t, err) {
+				return
+			}
+			conns[j] = conn
+		}
+		for _, conn := range conns {
+			pool.ReturnConnection(conn)
+		}
+
+		pool.Close()
+	}
+
+	runtime.GC()
+	var m2 runtime.MemStats
+	runtime.ReadMemStats(&m2)
+
+	// Memory should not grow significantly
+	memoryGrowth := int64(m2.HeapAlloc) - int64(m1.HeapAlloc)
+	t.Logf("Memory growth after 1000 pool cycles: %d bytes", memoryGrowth)
+
+	// Allow some growth but it should be minimal
+	assert.Less(t, memoryGrowth, int64(10*1024*1024), "Memory growth should be < 10MB")
+}
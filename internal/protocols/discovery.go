@@ -0,0 +1,164 @@
+package protocols
+
+import (
+	"bufio"
+	"context"
+	"encoding/binary"
+	"fmt"
+	"net"
+	"os"
+	"sort"
+	"strings"
+	"sync"
+)
+
+// DefaultARPTablePath is the Linux neighbour cache; hosts listed there are probed first
+const DefaultARPTablePath = "/proc/net/arp"
+
+// probeFunc checks a single address/port pair and returns the device found there, if any
+type probeFunc func(ctx context.Context, ip string, port int) *Device
+
+// scanNetwork probes every host address/port pair in an IPv4 network, keeping
+// at most concurrency probes in flight. Hosts present in the ARP table at
+// arpTablePath are known to be live and are probed before the rest of the range,
+// so devices on a warm network are found early; an empty path skips the lookup.
+// Devices are returned in completion order.
+// If ctx is cancelled the devices found so far are returned with ctx.Err().
+func scanNetwork(ctx context.Context, network *net.IPNet, ports []int, concurrency int, arpTablePath string, probe probeFunc) ([]*Device, error) {
+	devices := make([]*Device, 0)
+
+	first, last, ok := hostRange(network)
+	if !ok {
+		return devices, fmt.Errorf("network scanning only supports IPv4 ranges: %s", network)
+	}
+
+	if concurrency < 1 {
+		concurrency = 1
+	}
+
+	var (
+		wg    sync.WaitGroup
+		mutex sync.Mutex
+	)
+
+	// Limit in-flight probes so large ranges don't exhaust file descriptors
+	semaphore := make(chan struct{}, concurrency)
+
+	// probeHost starts a probe for each port on host, returning false once ctx is done
+	probeHost := func(host uint32) bool {
+		address := net.IPv4(byte(host>>24), byte(host>>16), byte(host>>8), byte(host)).String()
+
+		for _, port := range ports {
+			select {
+			case <-ctx.Done():
+				return false
+			case semaphore <- struct{}{}:
+			}
+
+			wg.Add(1)
+			go func(port int) {
+				defer wg.Done()
+				defer func() { <-semaphore }()
+
+				if device := probe(ctx, address, port); device != nil {
+					mutex.Lock()
+					devices = append(devices, device)
+					mutex.Unlock()
+				}
+			}(port)
+		}
+		return true
+	}
+
+	var known []uint32
+	if arpTablePath != "" {
+		known = arpHosts(arpTablePath, first, last)
+	}
+
+	scanning := true
+	for _, host := range known {
+		if scanning = probeHost(host); !scanning {
+			break
+		}
+	}
+
+	// Walk the remaining hosts as integers; the last address is checked before
+	// incrementing so 255.255.255.255 cannot wrap around
+	for host := first; scanning; host++ {
+		i := sort.Search(len(known), func(i int) bool { return known[i] >= host })
+		if i == len(known) || known[i] != host {
+			scanning = probeHost(host)
+		}
+
+		if host == last {
+			break
+		}
+	}
+
+	wg.Wait()
+	return devices, ctx.Err()
+}
+
+// arpHosts returns the sorted, resolved ARP cache entries between first and
+// last. A missing or unreadable table yields no hosts, so non-Linux systems
+// simply scan in address order.
+func arpHosts(path string, first, last uint32) []uint32 {
+	file, err := os.Open(path)
+	if err != nil {
+		return nil
+	}
+	defer file.Close()
+
+	var hosts []uint32
+	scanner := bufio.NewScanner(file)
+	scanner.Scan() // Skip header line
+
+	for scanner.Scan() {
+		// IP address, HW type, Flags, HW address, Mask, Device
+		fields := strings.Fields(scanner.Text())
+		if len(fields) < 3 || fields[2] == "0x0" { // 0x0 marks an incomplete entry
+			continue
+		}
+
+		ip := net.ParseIP(fields[0]).To4()
+		if ip == nil {
+			continue
+		}
+
+		if host := binary.BigEndian.Uint32(ip); host >= first && host <= last {
+			hosts = append(hosts, host)
+		}
+	}
+
+	sort.Slice(hosts, func(i, j int) bool { return hosts[i] < hosts[j] })
+
+	// The same address can appear once per interface
+	unique := hosts[:0]
+	for i, host := range hosts {
+		if i == 0 || host != hosts[i-1] {
+			unique = append(unique, host)
+		}
+	}
+	return unique
+}
+
+// hostRange returns the first and last host addresses of an IPv4 network as
+// integers. The network and broadcast addresses are excluded except for /31
+// and /32 networks, which have no room for them.
+func hostRange(network *net.IPNet) (first, last uint32, ok bool) {
+	ip := network.IP.To4()
+	if ip == nil || len(network.Mask) != net.IPv4len {
+		return 0, 0, false
+	}
+
+	mask := binary.BigEndian.Uint32(network.Mask)
+	first = binary.BigEndian.Uint32(ip) & mask
+	last = first | ^mask
+
+	if ones, bits := network.Mask.Size(); bits-ones >= 2 {
+		first++
+		last--
+	}
+
+	return first, last, true
+}
@@ -0,0 +1,167 @@
+package protocols
+
+import (
+	"context"
+	"fmt"
+	"net"
+	"os"
+	"path/filepath"
+	"sync"
+	"sync/atomic"
+	"testing"
+)
+
+func TestScanNetwork(t *testing.T) {
+	_, network, err := net.ParseCIDR("10.0.0.0/29")
+	if err != nil {
+		t.Fatalf("Failed to parse network: %v", err)
+	}
+
+	ports := []int{502, 503}
+	const concurrency = 3
+
+	var (
+		mutex    sync.Mutex
+		probed   = make(map[string]int)
+		inFlight int32
+		peak     int32
+	)
+
+	probe := func(ctx context.Context, ip string, port int) *Device {
+		current := atomic.AddInt32(&inFlight, 1)
+		defer atomic.AddInt32(&inFlight, -1)
+
+		mutex.Lock()
+		probed[fmt.Sprintf("%s:%d", ip, port)]++
+		if current > peak {
+			peak = current
+		}
+		mutex.Unlock()
+
+		if ip == "10.0.0.5" && port == 502 {
+			return &Device{Address: ip, Port: port}
+		}
+		return nil
+	}
+
+	devices, err := scanNetwork(context.Background(), network, ports, concurrency, "", probe)
+	if err != nil {
+		t.Fatalf("Unexpected error: %v", err)
+	}
+
+	// A /29 has six usable hosts; network and broadcast addresses are skipped
+	if len(probed) != 6*len(ports) {
+		t.Errorf("Expected %d address/port pairs probed, got %d", 6*len(ports), len(probed))
+	}
+	if _, found := probed["10.0.0.0:502"]; found {
+		t.Error("Network address should not be probed")
+	}
+	if _, found := probed["10.0.0.7:502"]; found {
+		t.Error("Broadcast address should not be probed")
+	}
+	for pair, count := range probed {
+		if count != 1 {
+			t.Errorf("Pair %q probed %d times", pair, count)
+		}
+	}
+	if peak > concurrency {
+		t.Errorf("Expected at most %d probes in flight, got %d", concurrency, peak)
+	}
+	if len(devices) != 1 || devices[0].Address != "10.0.0.5" {
+		t.Errorf("Expected single device at 10.0.0.5, got %v", devices)
+	}
+}
+
+func TestScanNetworkCancelled(t *testing.T) {
+	_, network, _ := net.ParseCIDR("10.0.0.0/24")
+
+	ctx, cancel := context.WithCancel(context.Background())
+	cancel()
+
+	devices, err := scanNetwork(ctx, network, []int{502}, 4, "", func(ctx context.Context, ip string, port int) *Device {
+		return nil
+	})
+	if err != context.Canceled {
+		t.Errorf("Expected context.Canceled, got: %v", err)
+	}
+	if devices == nil {
+		t.Error("Expected non-nil devices slice")
+	}
+}
+
+func TestScanNetworkProbesARPHostsFirst(t *testing.T) {
+	arpTable := filepath.Join(t.TempDir(), "arp")
+	content := `IP address       HW type     Flags       HW address            Mask     Device
+10.0.0.5         0x1         0x2         00:11:22:33:44:55     *        eth0
+10.0.0.3         0x1         0x2         00:11:22:33:44:66     *        eth0
+10.0.0.3         0x1         0x2         00:11:22:33:44:66     *        eth1
+10.0.0.4         0x1         0x0         00:00:00:00:00:00     *        eth0
+192.168.1.9      0x1         0x2         00:11:22:33:44:77     *        eth0
+`
+	if err := os.WriteFile(arpTable, []byte(content), 0o644); err != nil {
+		t.Fatalf("Failed to write ARP table: %v", err)
+	}
+
+	_, network, _ := net.ParseCIDR("10.0.0.0/29")
+
+	var (
+		mutex sync.Mutex
+		order []string
+	)
+
+	// A concurrency of one makes dispatch order observable
+	_, err := scanNetwork(context.Background(), network, []int{502}, 1, arpTable, func(ctx context.Context, ip string, port int) *Device {
+		mutex.Lock()
+		order = append(order, ip)
+		mutex.Unlock()
+		return nil
+	})
+	if err != nil {
+		t.Fatalf("Unexpected error: %v", err)
+	}
+
+	expected := []string{"10.0.0.3", "10.0.0.5", "10.0.0.1", "10.0.0.2", "10.0.0.4", "10.0.0.6"}
+	if fmt.Sprint(order) != fmt.Sprint(expected) {
+		t.Errorf("Expected probe order %v, got %v", expected, order)
+	}
+}
+
+func TestHostRange(t *testing.T) {
+	tests := []struct {
+		cidr  string
+		first string
+		last  string
+	}{
+		{"192.168.1.0/24", "192.168.1.1", "192.168.1.254"},
+		{"192.168.1.77/30", "192.168.1.77", "192.168.1.78"},
+		{"10.0.0.4/31", "10.0.0.4", "10.0.0.5"},
+		{"10.0.0.9/32", "10.0.0.9", "10.0.0.9"},
+		{"255.255.255.254/31", "255.255.255.254", "255.255.255.255"},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.cidr, func(t *testing.T) {
+			_, network, err := net.ParseCIDR(tt.cidr)
+			if err != nil {
+				t.Fatalf("Failed to parse network: %v", err)
+			}
+
+			first, last, ok := hostRange(network)
+			if !ok {
+				t.Fatal("Expected IPv4 network to be accepted")
+			}
+
+			toIP := func(n uint32) string {
+				return net.IPv4(byte(n>>24), byte(n>>16), byte(n>>8), byte(n)).String()
+			}
+			if toIP(first) != tt.first || toIP(last) != tt.last {
+				t.Errorf("Expected %s-%s, got %s-%s", tt.first, tt.last, toIP(first), toIP(last))
+			}
+		})
+	}
+
+	_, network, _ := net.ParseCIDR("2001:db8::/64")
+	if _, _, ok := hostRange(network); ok {
+		t.Error("Expected IPv6 network to be rejected")
+	}
+}
@@ -55,6 +55,10 @@ type EtherNetIPConfig struct {
 	SessionTimeout    time.Duration `yaml:"session_timeout"`
 	EnableImplicitIO  bool          `yaml:"enable_implicit_io"`
 	MaxPacketSize     int           `yaml:"max_packet_size"`
+
+	// Discovery settings
+	DiscoveryConcurrency int    `yaml:"discovery_concurrency"`
+	ARPTablePath         string `yaml:"arp_table_path"`
 }
 
 // CIP Constants
@@ -205,6 +209,9 @@ func NewEtherNetIPHandler(logger *zap.Logger) ProtocolHandler {
 			SessionTimeout:    30 * time.Second,
 			EnableImplicitIO:  true,
 			MaxPacketSize:     1500,
+
+			DiscoveryConcurrency: 64,
+			ARPTablePath:         DefaultARPTablePath,
 		},
 	}
 }
@@ -238,12 +245,13 @@ func (e *EtherNetIPHandler) Connect(device *Device) error {
 		return fmt.Errorf("failed to connect to EtherNet/IP device: %w", err)
 	}
 
+	now := time.Now()
 	conn := &EtherNetIPConnection{
 		tcpConn:        tcpConn,
-		lastUsed:       time.Now(),
+		lastUsed:       now,
 		deviceID:       device.ID,
 		isConnected:    true,
-		createdAt:      time.Now(),
+		createdAt:      now,
 		sequenceNumber: 0,
 	}
 
@@ -483,35 +491,20 @@ func (e *EtherNetIPHandler) ReadMultipleTags(device *Device, tags []*Tag) (map[s
 
 // DiscoverDevices scans a network range for EtherNet/IP devices
 func (e *EtherNetIPHandler) DiscoverDevices(ctx context.Context, networkRange string) ([]*Device, error) {
-	devices := make([]*Device, 0)
-
 	// Parse network range
 	_, network, err := net.ParseCIDR(networkRange)
 	if err != nil {
-		return devices, fmt.Errorf("invalid network range: %w", err)
+		return nil, fmt.Errorf("invalid network range: %w", err)
 	}
 
 	// Common EtherNet/IP ports to scan
-	ports := []int{DefaultTCPPort, 44818, 2222}
+	ports := []int{DefaultTCPPort, DefaultUDPPort}
 
 	// Scan network with timeout
 	scanCtx, cancel := context.WithTimeout(ctx, 30*time.Second)
 	defer cancel()
 
-	for ip := network.IP.Mask(network.Mask); network.Contains(ip); e.incrementIP(ip) {
-		for _, port := range ports {
-			select {
-			case <-scanCtx.Done():
-				return devices, scanCtx.Err()
-			default:
-				if device := e.probeEtherNetIPDevice(scanCtx, ip.String(), port); device != nil {
-					devices = append(devices, device)
-				}
-			}
-		}
-	}
-
-	return devices, nil
+	return scanNetwork(scanCtx, network, ports, e.config.DiscoveryConcurrency, e.config.ARPTablePath, e.probeEtherNetIPDevice)
 }
 
 // GetDeviceInfo retrieves detailed information about an EtherNet/IP device
@@ -646,16 +639,6 @@ func (e *EtherNetIPHandler) getConnection(device *Device) (*EtherNetIPConnection
 	return conn, nil
 }
 
-// incrementIP increments an IP address for network scanning
-func (e *EtherNetIPHandler) incrementIP(ip net.IP) {
-	for j := len(ip) - 1; j >= 0; j-- {
-		ip[j]++
-		if ip[j] > 0 {
-			break
-		}
-	}
-}
-
 // parseAddress parses an EtherNet/IP tag address string
 func (e *EtherNetIPHandler) parseAddress(address string) (*EtherNetIPAddress, error) {
 	// Validate address is not empty
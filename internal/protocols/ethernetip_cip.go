@@ -14,6 +14,13 @@ import (
 
 // CIP Session Management and Protocol Implementation
 
+// encapsulationHeaderSize is the fixed size of an EtherNet/IP encapsulation header
+const encapsulationHeaderSize = 24
+
+// registerSessionData is the constant Register Session payload sent by every
+// session setup and discovery probe: Protocol Version = 1, Options = 0
+var registerSessionData = []byte{0x01, 0x00, 0x00, 0x00}
+
 // registerSession registers a new CIP session with the device
 func (e *EtherNetIPHandler) registerSession(conn *EtherNetIPConnection) (uint32, error) {
 	// Build Register Session request
@@ -25,13 +32,8 @@ func (e *EtherNetIPHandler) registerSession(conn *EtherNetIPConnection) (uint32,
 		Options:       0,
 	}
 
-	// Register Session data (Protocol Version = 1, Options = 0)
-	data := make([]byte, 4)
-	binary.LittleEndian.PutUint16(data[0:2], 1) // Protocol Version
-	binary.LittleEndian.PutUint16(data[2:4], 0) // Options
-
 	// Send request
-	if err := e.sendEncapsulationRequest(conn, &header, data); err != nil {
+	if err := e.sendEncapsulationRequest(conn, &header, registerSessionData); err != nil {
 		return 0, err
 	}
 
@@ -141,22 +143,18 @@ func (e *EtherNetIPHandler) sendCIPRequest(conn *EtherNetIPConnection, request *
 	return e.parseCIPResponse(respData)
 }
 
-// sendEncapsulationRequest sends an encapsulation request
+// sendEncapsulationRequest sends an encapsulation header and its data in a single write
 func (e *EtherNetIPHandler) sendEncapsulationRequest(conn *EtherNetIPConnection, header *CIPEncapsulationHeader, data []byte) error {
 	// Set connection timeout
 	conn.tcpConn.SetWriteDeadline(time.Now().Add(e.config.DefaultTimeout))
 
-	// Send header
-	if err := e.sendEncapsulationHeader(conn, header); err != nil {
-		return err
-	}
+	// Header and data share one buffer so the request leaves as one segment
+	buf := make([]byte, encapsulationHeaderSize+len(data))
+	putEncapsulationHeader(buf, header)
+	copy(buf[encapsulationHeaderSize:], data)
 
-	// Send data if present
-	if len(data) > 0 {
-		_, err := conn.tcpConn.Write(data)
-		if err != nil {
-			return fmt.Errorf("failed to send encapsulation data: %w", err)
-		}
+	if _, err := conn.tcpConn.Write(buf); err != nil {
+		return fmt.Errorf("failed to send encapsulation request: %w", err)
 	}
 
 	return nil
@@ -188,14 +186,8 @@ func (e *EtherNetIPHandler) readEncapsulationResponse(conn *EtherNetIPConnection
 
 // sendEncapsulationHeader sends an encapsulation header
 func (e *EtherNetIPHandler) sendEncapsulationHeader(conn *EtherNetIPConnection, header *CIPEncapsulationHeader) error {
-	buf := make([]byte, 24) // Encapsulation header size
-
-	binary.LittleEndian.PutUint16(buf[0:2], header.Command)
-	binary.LittleEndian.PutUint16(buf[2:4], header.Length)
-	binary.LittleEndian.PutUint32(buf[4:8], header.SessionHandle)
-	binary.LittleEndian.PutUint32(buf[8:12], header.Status)
-	copy(buf[12:20], header.Context[:])
-	binary.LittleEndian.PutUint32(buf[20:24], header.Options)
+	buf := make([]byte, encapsulationHeaderSize)
+	putEncapsulationHeader(buf, header)
 
 	_, err := conn.tcpConn.Write(buf)
 	if err != nil {
@@ -205,9 +197,19 @@ func (e *EtherNetIPHandler) sendEncapsulationHeader(conn *EtherNetIPConnection,
 	return nil
 }
 
+// putEncapsulationHeader encodes an encapsulation header into the start of buf
+func putEncapsulationHeader(buf []byte, header *CIPEncapsulationHeader) {
+	binary.LittleEndian.PutUint16(buf[0:2], header.Command)
+	binary.LittleEndian.PutUint16(buf[2:4], header.Length)
+	binary.LittleEndian.PutUint32(buf[4:8], header.SessionHandle)
+	binary.LittleEndian.PutUint32(buf[8:12], header.Status)
+	copy(buf[12:20], header.Context[:])
+	binary.LittleEndian.PutUint32(buf[20:24], header.Options)
+}
+
 // readEncapsulationHeader reads an encapsulation header
 func (e *EtherNetIPHandler) readEncapsulationHeader(conn *EtherNetIPConnection) (*CIPEncapsulationHeader, error) {
-	buf := make([]byte, 24)
+	buf := make([]byte, encapsulationHeaderSize)
 	_, err := conn.tcpConn.Read(buf)
 	if err != nil {
 		return nil, fmt.Errorf("failed to read encapsulation header: %w", err)
@@ -354,53 +356,39 @@ func (e *EtherNetIPHandler) buildInstancePath(classID uint16, instanceID uint32,
 
 // buildCIPRequestData builds CIP request data
 func (e *EtherNetIPHandler) buildCIPRequestData(request *CIPRequest) []byte {
-	var data []byte
+	// Request path size (in words), padded to an even length
+	pathLen := len(request.RequestPath)
+	paddedPathLen := pathLen + pathLen%2
 
-	// Service code
-	data = append(data, request.Service)
+	// Size the buffer up front: service + path size + path + pad + data
+	data := make([]byte, 2+paddedPathLen+len(request.RequestData))
 
-	// Request path size (in words)
-	pathSize := len(request.RequestPath) / 2
-	if len(request.RequestPath)%2 != 0 {
-		pathSize++
-	}
-	data = append(data, byte(pathSize))
-
-	// Request path
-	data = append(data, request.RequestPath...)
-
-	// Pad to even length
-	if len(request.RequestPath)%2 != 0 {
-		data = append(data, 0x00)
-	}
-
-	// Request data
-	data = append(data, request.RequestData...)
+	data[0] = request.Service
+	data[1] = byte(paddedPathLen / 2)
+	copy(data[2:], request.RequestPath)
+	copy(data[2+paddedPathLen:], request.RequestData)
 
 	return data
 }
 
 // buildCPFData builds Common Packet Format data
 func (e *EtherNetIPHandler) buildCPFData(cpf *CIPCommonPacketFormat) []byte {
-	var data []byte
+	// Item count (2) + address item (4) + data item header (4) + data
+	data := make([]byte, 10+len(cpf.Data))
 
 	// Item count
 	binary.LittleEndian.PutUint16(data[0:2], cpf.ItemCount)
-	data = append(data, make([]byte, 2)...)
-	binary.LittleEndian.PutUint16(data[0:2], cpf.ItemCount)
 
 	// Address item
-	data = append(data, make([]byte, 4)...)
-	binary.LittleEndian.PutUint16(data[len(data)-4:], 0x0000) // NULL Address Type
-	binary.LittleEndian.PutUint16(data[len(data)-2:], 0x0000) // Length = 0
+	binary.LittleEndian.PutUint16(data[2:4], 0x0000) // NULL Address Type
+	binary.LittleEndian.PutUint16(data[4:6], 0x0000) // Length = 0
 
 	// Data item
-	data = append(data, make([]byte, 4)...)
-	binary.LittleEndian.PutUint16(data[len(data)-4:], 0x00B2) // Unconnected Data Item
-	binary.LittleEndian.PutUint16(data[len(data)-2:], uint16(len(cpf.Data)))
+	binary.LittleEndian.PutUint16(data[6:8], 0x00B2) // Unconnected Data Item
+	binary.LittleEndian.PutUint16(data[8:10], uint16(len(cpf.Data)))
 
 	// Data
-	data = append(data, cpf.Data...)
+	copy(data[10:], cpf.Data)
 
 	return data
 }
@@ -746,9 +734,9 @@ func (e *EtherNetIPHandler) readSingleTag(conn *EtherNetIPConnection, tag *Tag)
 
 // probeEtherNetIPDevice probes for EtherNet/IP devices
 func (e *EtherNetIPHandler) probeEtherNetIPDevice(ctx context.Context, ip string, port int) *Device {
-	timeout := 2 * time.Second
+	dialer := net.Dialer{Timeout: 2 * time.Second}
 
-	conn, err := net.DialTimeout("tcp", fmt.Sprintf("%s:%d", ip, port), timeout)
+	conn, err := dialer.DialContext(ctx, "tcp", net.JoinHostPort(ip, strconv.Itoa(port)))
 	if err != nil {
 		return nil
 	}
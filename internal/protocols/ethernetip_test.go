@@ -2,7 +2,9 @@ package protocols
 
 import (
 	"context"
+	"errors"
 	"fmt"
+	"net"
 	"testing"
 	"time"
 
@@ -228,6 +230,9 @@ func TestEtherNetIPHandler_ValidateTagAddress(t *testing.T) {
 }
 
 func TestEtherNetIPHandler_DiscoverDevices(t *testing.T) {
+	// Discovery waits on real dial timeouts; let it overlap with the other tests
+	t.Parallel()
+
 	logger := zap.NewNop()
 	handler := NewEtherNetIPHandler(logger)
 
@@ -236,7 +241,8 @@ func TestEtherNetIPHandler_DiscoverDevices(t *testing.T) {
 
 	// Test with invalid network range
 	devices, err := handler.DiscoverDevices(ctx, "invalid-range")
-	assert.Error(t, err)
+	var parseErr *net.ParseError
+	assert.True(t, errors.As(err, &parseErr), "expected *net.ParseError, got: %v", err)
 	assert.Nil(t, devices)
 
 	// Test with valid network range (should complete without error even if no devices found)
@@ -404,6 +410,42 @@ func TestEtherNetIPEncapsulationHeader(t *testing.T) {
 	assert.Equal(t, uint32(0x12345678), header.SessionHandle)
 	assert.Equal(t, uint32(0), header.Status)
 	assert.Equal(t, uint32(0), header.Options)
+
+	buf := make([]byte, encapsulationHeaderSize)
+	putEncapsulationHeader(buf, &header)
+	assert.Equal(t, []byte{
+		0x65, 0x00, // Command
+		0x04, 0x00, // Length
+		0x78, 0x56, 0x34, 0x12, // Session handle
+		0x00, 0x00, 0x00, 0x00, // Status
+		0, 0, 0, 0, 0, 0, 0, 0, // Sender context
+		0x00, 0x00, 0x00, 0x00, // Options
+	}, buf)
+}
+
+func TestCIPRequestFraming(t *testing.T) {
+	logger := zap.NewNop()
+	handler := NewEtherNetIPHandler(logger).(*EtherNetIPHandler)
+
+	// Odd-length path is padded to a whole word
+	request := &CIPRequest{
+		Service:     CIPServiceGetAttributeSingle,
+		RequestPath: []byte{0x20, 0x01, 0x24},
+		RequestData: []byte{0xAA, 0xBB},
+	}
+	requestData := handler.buildCIPRequestData(request)
+	assert.Equal(t, []byte{0x0E, 0x02, 0x20, 0x01, 0x24, 0x00, 0xAA, 0xBB}, requestData)
+
+	cpfData := handler.buildCPFData(&CIPCommonPacketFormat{
+		ItemCount: 2,
+		Data:      requestData,
+	})
+	assert.Equal(t, []byte{
+		0x02, 0x00, // Item count
+		0x00, 0x00, 0x00, 0x00, // NULL address item
+		0xB2, 0x00, 0x08, 0x00, // Unconnected data item, length 8
+	}, cpfData[:10])
+	assert.Equal(t, requestData, cpfData[10:])
 }
 
 func TestCIPIdentityObjectParsing(t *testing.T) {
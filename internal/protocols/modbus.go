@@ -4,6 +4,7 @@ import (
 	"context"
 	"encoding/binary"
 	"fmt"
+	"math"
 	"net"
 	"strconv"
 	"strings"
@@ -44,6 +45,10 @@ type ModbusConfig struct {
 	ReadTimeout       time.Duration `yaml:"read_timeout"`
 	WriteTimeout      time.Duration `yaml:"write_timeout"`
 	EnableKeepAlive   bool          `yaml:"enable_keep_alive"`
+
+	// Discovery settings
+	DiscoveryConcurrency int    `yaml:"discovery_concurrency"`
+	ARPTablePath         string `yaml:"arp_table_path"`
 }
 
 // ModbusAddress represents parsed Modbus address information
@@ -83,6 +88,9 @@ func NewModbusHandler(logger *zap.Logger) ProtocolHandler {
 			ReadTimeout:       5 * time.Second,
 			WriteTimeout:      5 * time.Second,
 			EnableKeepAlive:   true,
+
+			DiscoveryConcurrency: 64,
+			ARPTablePath:         DefaultARPTablePath,
 		},
 	}
 }
@@ -115,13 +123,14 @@ func (m *ModbusHandler) Connect(device *Device) error {
 
 	client := modbus.NewClient(handler)
 
+	now := time.Now()
 	conn := &ModbusConnection{
 		client:      client,
 		handler:     handler,
-		lastUsed:    time.Now(),
+		lastUsed:    now,
 		deviceID:    device.ID,
 		isConnected: true,
-		createdAt:   time.Now(),
+		createdAt:   now,
 	}
 
 	m.connections.Store(connectionKey, conn)
@@ -190,51 +199,10 @@ func (m *ModbusHandler) ReadTag(device *Device, tag *Tag) (interface{}, error) {
 	conn.mutex.Lock()
 	defer conn.mutex.Unlock()
 
-	addr, err := m.parseAddress(tag.Address)
-	if err != nil {
-		return nil, fmt.Errorf("invalid Modbus address %s: %w", tag.Address, err)
-	}
-
 	// Update last used time
 	conn.lastUsed = time.Now()
 
-	var result []byte
-
-	switch addr.FunctionCode {
-	case ReadCoils:
-		coils, err := conn.client.ReadCoils(addr.Address, addr.Count)
-		if err != nil {
-			return nil, err
-		}
-		result = coils
-
-	case ReadDiscreteInputs:
-		inputs, err := conn.client.ReadDiscreteInputs(addr.Address, addr.Count)
-		if err != nil {
-			return nil, err
-		}
-		result = inputs
-
-	case ReadHoldingRegisters:
-		registers, err := conn.client.ReadHoldingRegisters(addr.Address, addr.Count)
-		if err != nil {
-			return nil, err
-		}
-		result = registers
-
-	case ReadInputRegisters:
-		registers, err := conn.client.ReadInputRegisters(addr.Address, addr.Count)
-		if err != nil {
-			return nil, err
-		}
-		result = registers
-
-	default:
-		return nil, fmt.Errorf("unsupported read function code: %d", addr.FunctionCode)
-	}
-
-	// Convert binary result to appropriate data type
-	return m.convertFromModbus(result, tag.DataType, addr.FunctionCode)
+	return m.readSingleTag(conn, tag)
 }
 
 // WriteTag writes a value to a Modbus device
@@ -331,32 +299,18 @@ func (m *ModbusHandler) ReadMultipleTags(device *Device, tags []*Tag) (map[strin
 
 // DiscoverDevices scans a network range for Modbus devices
 func (m *ModbusHandler) DiscoverDevices(ctx context.Context, networkRange string) ([]*Device, error) {
-	devices := make([]*Device, 0)
-
 	// Parse network range (e.g., "192.168.1.0/24")
 	_, network, err := net.ParseCIDR(networkRange)
 	if err != nil {
-		return devices, fmt.Errorf("invalid network range: %w", err)
+		return nil, fmt.Errorf("invalid network range: %w", err)
 	}
 
 	// Common Modbus ports to scan
 	ports := []int{502, 503, 10502}
 
-	// Scan network
-	for ip := network.IP.Mask(network.Mask); network.Contains(ip); m.incrementIP(ip) {
-		for _, port := range ports {
-			select {
-			case <-ctx.Done():
-				return devices, ctx.Err()
-			default:
-				if device := m.probeModbusDevice(ctx, ip.String(), port); device != nil {
-					devices = append(devices, device)
-				}
-			}
-		}
-	}
-
-	return devices, nil
+	// Probe hosts concurrently; most addresses in a range never answer, so a
+	// sequential scan spends nearly all of its time waiting on dial timeouts
+	return scanNetwork(ctx, network, ports, m.config.DiscoveryConcurrency, m.config.ARPTablePath, m.probeModbusDevice)
 }
 
 // GetDeviceInfo retrieves detailed information about a Modbus device
@@ -577,7 +531,7 @@ func (m *ModbusHandler) convertFromModbus(data []byte, dataType string, funcCode
 		}
 		// Convert to IEEE 754 float32
 		bits := binary.BigEndian.Uint32(data)
-		return float32(bits), nil
+		return math.Float32frombits(bits), nil
 
 	default:
 		return nil, fmt.Errorf("unsupported data type: %s", dataType)
@@ -651,33 +605,66 @@ func (m *ModbusHandler) readTagBatch(conn *ModbusConnection, tags []*Tag) (map[s
 	return results, nil
 }
 
+// readSingleTag reads one tag over an open connection. The caller holds conn.mutex.
 func (m *ModbusHandler) readSingleTag(conn *ModbusConnection, tag *Tag) (interface{}, error) {
-	// Individual tag read implementation
 	addr, err := m.parseAddress(tag.Address)
 	if err != nil {
-		return nil, err
+		return nil, fmt.Errorf("invalid Modbus address %s: %w", tag.Address, err)
+	}
+
+	// 32-bit values span two consecutive registers
+	switch DataType(tag.DataType) {
+	case DataTypeInt32, DataTypeUInt32, DataTypeFloat32:
+		if addr.FunctionCode == ReadHoldingRegisters || addr.FunctionCode == ReadInputRegisters {
+			addr.Count = 2
+		}
 	}
 
 	var result []byte
 
 	switch addr.FunctionCode {
+	case ReadCoils:
+		coils, err := conn.client.ReadCoils(addr.Address, addr.Count)
+		if err != nil {
+			return nil, err
+		}
+		result = coils
+
+	case ReadDiscreteInputs:
+		inputs, err := conn.client.ReadDiscreteInputs(addr.Address, addr.Count)
+		if err != nil {
+			return nil, err
+		}
+		result = inputs
+
 	case ReadHoldingRegisters:
-		registers, err := conn.client.ReadHoldingRegisters(addr.Address, 1)
+		registers, err := conn.client.ReadHoldingRegisters(addr.Address, addr.Count)
 		if err != nil {
 			return nil, err
 		}
 		result = registers
-		// Add other function codes as needed
+
+	case ReadInputRegisters:
+		registers, err := conn.client.ReadInputRegisters(addr.Address, addr.Count)
+		if err != nil {
+			return nil, err
+		}
+		result = registers
+
+	default:
+		return nil, fmt.Errorf("unsupported read function code: %d", addr.FunctionCode)
 	}
 
+	// Convert binary result to appropriate data type
 	return m.convertFromModbus(result, tag.DataType, addr.FunctionCode)
 }
 
 func (m *ModbusHandler) probeModbusDevice(ctx context.Context, ip string, port int) *Device {
-	// Quick probe to see if a Modbus device responds at this address
-	timeout := 2 * time.Second
+	// Quick probe to see if a Modbus device responds at this address.
+	// The dialer honours ctx so a cancelled scan abandons pending connects.
+	dialer := net.Dialer{Timeout: 2 * time.Second}
 
-	conn, err := net.DialTimeout("tcp", fmt.Sprintf("%s:%d", ip, port), timeout)
+	conn, err := dialer.DialContext(ctx, "tcp", net.JoinHostPort(ip, strconv.Itoa(port)))
 	if err != nil {
 		return nil
 	}
@@ -693,12 +680,3 @@ func (m *ModbusHandler) probeModbusDevice(ctx context.Context, ip string, port i
 		Config:   make(map[string]interface{}),
 	}
 }
-
-func (m *ModbusHandler) incrementIP(ip net.IP) {
-	for j := len(ip) - 1; j >= 0; j-- {
-		ip[j]++
-		if ip[j] > 0 {
-			break
-		}
-	}
-}
@@ -2,14 +2,18 @@ package protocols
 
 import (
 	"context"
+	"errors"
+	"math"
+	"net"
 	"testing"
 	"time"
 
+	"github.com/goburrow/modbus"
 	"go.uber.org/zap"
 )
 
 func TestModbusHandler(t *testing.T) {
-	logger, _ := zap.NewDevelopment()
+	logger := zap.NewNop()
 	handler := NewModbusHandler(logger)
 
 	// Test supported data types
@@ -45,7 +49,7 @@ func TestModbusHandler(t *testing.T) {
 }
 
 func TestModbusAddressParsing(t *testing.T) {
-	logger, _ := zap.NewDevelopment()
+	logger := zap.NewNop()
 	handler := NewModbusHandler(logger).(*ModbusHandler)
 
 	tests := []struct {
@@ -136,42 +140,36 @@ func TestModbusAddressParsing(t *testing.T) {
 }
 
 func TestModbusDataConversion(t *testing.T) {
-	logger, _ := zap.NewDevelopment()
+	logger := zap.NewNop()
 	handler := NewModbusHandler(logger).(*ModbusHandler)
 
-	// Test bool conversion
-	boolData := []byte{0x01}
-	result, err := handler.convertFromModbus(boolData, "bool", ReadCoils)
-	if err != nil {
-		t.Errorf("Error converting bool: %v", err)
-	}
-	if result != true {
-		t.Errorf("Expected true, got %v", result)
-	}
-
-	// Test uint16 conversion
-	uint16Data := []byte{0x01, 0x00} // Big endian 256
-	result, err = handler.convertFromModbus(uint16Data, "uint16", ReadHoldingRegisters)
-	if err != nil {
-		t.Errorf("Error converting uint16: %v", err)
-	}
-	if result != uint16(256) {
-		t.Errorf("Expected 256, got %v", result)
+	tests := []struct {
+		name     string
+		data     []byte
+		dataType string
+		funcCode ModbusFunctionCode
+		expected interface{}
+	}{
+		{"bool", []byte{0x01}, "bool", ReadCoils, true},
+		{"uint16", []byte{0x01, 0x00}, "uint16", ReadHoldingRegisters, uint16(256)}, // Big endian 256
+		{"int16", []byte{0xFF, 0xFF}, "int16", ReadHoldingRegisters, int16(-1)},     // Big endian -1
 	}
 
-	// Test int16 conversion
-	int16Data := []byte{0xFF, 0xFF} // Big endian -1
-	result, err = handler.convertFromModbus(int16Data, "int16", ReadHoldingRegisters)
-	if err != nil {
-		t.Errorf("Error converting int16: %v", err)
-	}
-	if result != int16(-1) {
-		t.Errorf("Expected -1, got %v", result)
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			result, err := handler.convertFromModbus(tt.data, tt.dataType, tt.funcCode)
+			if err != nil {
+				t.Fatalf("Error converting %s: %v", tt.dataType, err)
+			}
+			if result != tt.expected {
+				t.Errorf("Expected %v, got %v", tt.expected, result)
+			}
+		})
 	}
 }
 
 func BenchmarkModbusAddressParsing(b *testing.B) {
-	logger, _ := zap.NewDevelopment()
+	logger := zap.NewNop()
 	handler := NewModbusHandler(logger).(*ModbusHandler)
 
 	addresses := []string{"40001", "40100", "30001", "00001", "10001"}
@@ -185,7 +183,7 @@ func BenchmarkModbusAddressParsing(b *testing.B) {
 }
 
 func BenchmarkModbusDataConversion(b *testing.B) {
-	logger, _ := zap.NewDevelopment()
+	logger := zap.NewNop()
 	handler := NewModbusHandler(logger).(*ModbusHandler)
 
 	testData := []byte{0x01, 0x00}
@@ -197,14 +195,21 @@ func BenchmarkModbusDataConversion(b *testing.B) {
 }
 
 func TestModbusDeviceDiscovery(t *testing.T) {
-	logger, _ := zap.NewDevelopment()
+	// Discovery waits on real dial timeouts; let it overlap with the other tests
+	t.Parallel()
+
+	logger := zap.NewNop()
 	handler := NewModbusHandler(logger)
 
 	// Test with invalid network range
 	ctx := context.Background()
-	_, err := handler.DiscoverDevices(ctx, "invalid-range")
-	if err == nil {
-		t.Error("Expected error for invalid network range")
+	devices, err := handler.DiscoverDevices(ctx, "invalid-range")
+	var parseErr *net.ParseError
+	if !errors.As(err, &parseErr) {
+		t.Errorf("Expected *net.ParseError for invalid network range, got: %v", err)
+	}
+	if devices != nil {
+		t.Errorf("Expected nil devices for invalid network range, got: %v", devices)
 	}
 
 	// Test with valid but unreachable network range
@@ -212,7 +217,7 @@ func TestModbusDeviceDiscovery(t *testing.T) {
 	// Use a very small network range and short timeout to avoid long test times
 	ctx, cancel := context.WithTimeout(context.Background(), 1*time.Second)
 	defer cancel()
-	devices, err := handler.DiscoverDevices(ctx, "192.168.99.0/30")
+	devices, err = handler.DiscoverDevices(ctx, "192.168.99.0/30")
 
 	// We expect either no error or a context timeout error
 	if err != nil && err != context.DeadlineExceeded {
@@ -226,7 +231,7 @@ func TestModbusDeviceDiscovery(t *testing.T) {
 }
 
 func TestModbusConnectionManagement(t *testing.T) {
-	logger, _ := zap.NewDevelopment()
+	logger := zap.NewNop()
 	handler := NewModbusHandler(logger)
 
 	// Create a test device
@@ -258,7 +263,7 @@ func TestModbusConnectionManagement(t *testing.T) {
 }
 
 func TestModbusDeviceInfo(t *testing.T) {
-	logger, _ := zap.NewDevelopment()
+	logger := zap.NewNop()
 	handler := NewModbusHandler(logger)
 
 	device := &Device{
@@ -281,3 +286,95 @@ func TestModbusDeviceInfo(t *testing.T) {
 		t.Error("Expected non-empty capabilities")
 	}
 }
+
+// fakeModbusClient serves reads from in-memory coils and registers
+type fakeModbusClient struct {
+	modbus.Client
+	coils     map[uint16]bool
+	registers map[uint16]uint16
+}
+
+func (c *fakeModbusClient) ReadCoils(address, quantity uint16) ([]byte, error) {
+	value, ok := c.coils[address]
+	if !ok {
+		return nil, errors.New("illegal data address")
+	}
+	if value {
+		return []byte{0x01}, nil
+	}
+	return []byte{0x00}, nil
+}
+
+func (c *fakeModbusClient) ReadDiscreteInputs(address, quantity uint16) ([]byte, error) {
+	return c.ReadCoils(address, quantity)
+}
+
+func (c *fakeModbusClient) ReadHoldingRegisters(address, quantity uint16) ([]byte, error) {
+	data := make([]byte, 0, 2*quantity)
+	for i := uint16(0); i < quantity; i++ {
+		value, ok := c.registers[address+i]
+		if !ok {
+			return nil, errors.New("illegal data address")
+		}
+		data = append(data, byte(value>>8), byte(value))
+	}
+	return data, nil
+}
+
+func (c *fakeModbusClient) ReadInputRegisters(address, quantity uint16) ([]byte, error) {
+	return c.ReadHoldingRegisters(address, quantity)
+}
+
+func TestModbusReadTags(t *testing.T) {
+	handler := NewModbusHandler(zap.NewNop()).(*ModbusHandler)
+
+	bits := math.Float32bits(12.5)
+	client := &fakeModbusClient{
+		coils: map[uint16]bool{2: true},
+		registers: map[uint16]uint16{
+			9:  uint16(bits >> 16),
+			10: uint16(bits),
+			4:  0x0001,
+			5:  0x0002,
+		},
+	}
+	handler.connections.Store("fake", &ModbusConnection{client: client, isConnected: true})
+	device := &Device{ID: "plc-1", ConnectionID: "fake"}
+
+	tags := []*Tag{
+		{ID: "coil", Address: "00003", DataType: "bool"},
+		{ID: "float", Address: "40010", DataType: "float32"},
+		{ID: "counter", Address: "30005", DataType: "uint32"},
+		{ID: "missing", Address: "40100", DataType: "uint16"},
+	}
+	expected := map[string]interface{}{
+		"coil":    true,
+		"float":   float32(12.5),
+		"counter": uint32(0x00010002),
+	}
+
+	for _, tag := range tags[:3] {
+		value, err := handler.ReadTag(device, tag)
+		if err != nil {
+			t.Errorf("Unexpected error reading %s: %v", tag.ID, err)
+			continue
+		}
+		if value != expected[tag.ID] {
+			t.Errorf("Expected %s = %v, got %v", tag.ID, expected[tag.ID], value)
+		}
+	}
+
+	// Unreadable tags are left out of the results
+	results, err := handler.ReadMultipleTags(device, tags)
+	if err != nil {
+		t.Fatalf("Unexpected error: %v", err)
+	}
+	if len(results) != len(expected) {
+		t.Errorf("Expected %d values, got %v", len(expected), results)
+	}
+	for id, want := range expected {
+		if results[id] != want {
+			t.Errorf("Expected %s = %v, got %v", id, want, results[id])
+		}
+	}
+}